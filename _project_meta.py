@@ -0,0 +1,28 @@
+"""
+Shared WordSuggest project layout used by test_runner.py and verify_project.py
+"""
+
+import os
+from typing import Final, FrozenSet, Iterable, Optional
+
+XCODE_PROJECT: Final = 'WordSuggest.xcodeproj/project.pbxproj'
+
+REQUIRED_FILES: Final = (
+    'main.swift',
+    'AppDelegate.swift',
+    'TextMonitor.swift',
+    'WordSuggestionService.swift',
+    'SuggestionWindow.swift',
+    'Info.plist',
+    XCODE_PROJECT
+)
+
+def present_files(names: Optional[Iterable[str]] = None) -> FrozenSet[str]:
+    """Project paths that exist; pass the file names from an existing scan of '.' to skip rescanning"""
+    if names is None:
+        with os.scandir('.') as entries:
+            names = [entry.name for entry in entries if entry.is_file()]
+    present = frozenset(names)
+    if os.path.isfile(XCODE_PROJECT):
+        present |= {XCODE_PROJECT}
+    return present
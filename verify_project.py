@@ -1,32 +1,32 @@
 #!/usr/bin/env python3
 import os
 import sys
+from typing import Final
+
+from _project_meta import REQUIRED_FILES, present_files
+
+# Nothing else is worth checking if the app entry points are missing
+_ENTRY_POINTS: Final = ('main.swift', 'AppDelegate.swift')
 
 def verify_project_structure():
     """Verify the WordSuggest project structure"""
-    required_files = [
-        'main.swift',
-        'AppDelegate.swift', 
-        'TextMonitor.swift',
-        'WordSuggestionService.swift',
-        'SuggestionWindow.swift',
-        'Info.plist',
-        'WordSuggest.xcodeproj/project.pbxproj'
-    ]
-    
     missing_files = []
-    present_files = []
+    found_files = []
+    present = present_files()
     
-    for file in required_files:
-        if os.path.exists(file):
-            present_files.append(file)
+    for file in REQUIRED_FILES:
+        if file in present:
+            found_files.append(file)
             print(f"✓ Found: {file}")
         else:
             missing_files.append(file)
             print(f"✗ Missing: {file}")
+            if file in _ENTRY_POINTS:
+                print(f"\n✗ Cannot verify project without {file}")
+                return False
     
     print(f"\nProject verification summary:")
-    print(f"Present files: {len(present_files)}/{len(required_files)}")
+    print(f"Present files: {len(found_files)}/{len(REQUIRED_FILES)}")
     print(f"Missing files: {len(missing_files)}")
     
     if missing_files: